@@ -1,4 +1,7 @@
+import copy
 import logging
+import time
+import typing as t
 
 import discord
 from discord.ext import commands
@@ -18,34 +21,55 @@ class Meta(ModmailCog):
 
     def __init__(self, bot: ModmailBot):
         self.bot = bot
+        # ping responds with "Pong!" and its alias pong responds with "Ping!"
+        self._ping_embed = discord.Embed(title="Pong!")
+        self._pong_embed = discord.Embed(title="Ping!")
+        self._pinging_embed = discord.Embed(title="Pinging...")
+        self._uptime_cache: t.Optional[t.Tuple[int, discord.Embed]] = None
+        self._prefix_cache: t.Optional[t.Tuple[str, discord.Embed]] = None
 
     @commands.command(name="ping", aliases=("pong",))
     async def ping(self, ctx: commands.Context) -> None:
-        """Ping the bot to see its latency and state."""
-        await ctx.send(
-            embed=discord.Embed(
-                title=("ping" if ctx.invoked_with.lower() == "pong" else "pong").capitalize() + "!",
-                description=f"`{round(self.bot.latency * 1000)}`ms",
-            )
-        )
+        """
+        Ping the bot to see its latency and state.
+
+        The gateway latency is the last websocket heartbeat round trip, while the api latency is
+        the time it took to send the initial response message.
+        """
+        start = time.perf_counter_ns()
+        msg = await ctx.send(embed=self._pinging_embed)
+        api_latency = (time.perf_counter_ns() - start) / 1_000_000
+
+        # commands are case insensitive, so only the second letter distinguishes ping from pong
+        embed = copy.copy(self._pong_embed if ctx.invoked_with[1] in "oO" else self._ping_embed)
+        embed.description = f"Gateway: `{round(self.bot.latency * 1000)}`ms | API: `{api_latency:.1f}`ms"
+        await msg.edit(embed=embed)
 
     @commands.command(name="uptime")
     async def uptime(self, ctx: commands.Context) -> None:
         """Get the current uptime of the bot."""
-        timestamp = round(float(self.bot.start_time.format("X")))
-        await ctx.send(
-            embed=discord.Embed(title="Up since:", description=f"<t:{timestamp}:F> (<t:{timestamp}:R>)")
-        )
+        timestamp = self.bot.start_time.int_timestamp
+        # the start time only changes if the bot is restarted, so only rebuild the embed when it does
+        if self._uptime_cache is None or self._uptime_cache[0] != timestamp:
+            self._uptime_cache = (
+                timestamp,
+                discord.Embed(title="Up since:", description=f"<t:{timestamp}:F> (<t:{timestamp}:R>)"),
+            )
+        await ctx.send(embed=self._uptime_cache[1])
 
     @commands.command(name="prefix")
     async def prefix(self, ctx: commands.Context) -> None:
         """Return the configured prefix."""
-        await ctx.send(
-            embed=discord.Embed(
-                title="Current Prefix",
-                description=f"My currently configured prefix is `{self.bot.config.user.bot.prefix}`.",
+        prefix = self.bot.config.user.bot.prefix
+        # the prefix is rarely changed, so only rebuild the embed when it is
+        if self._prefix_cache is None or self._prefix_cache[0] != prefix:
+            self._prefix_cache = (
+                prefix,
+                discord.Embed(
+                    title="Current Prefix", description=f"My currently configured prefix is `{prefix}`."
+                ),
             )
-        )
+        await ctx.send(embed=self._prefix_cache[1])
 
 
 def setup(bot: ModmailBot) -> None:
@@ -1,7 +1,7 @@
-from dataclasses import dataclass
 from enum import IntEnum, auto
 from typing import TYPE_CHECKING
 
+import attr
 from discord.ext import commands
 
 
@@ -32,7 +32,7 @@ class BotModes(BitwiseAutoEnum):
 BOT_MODES = BotModes
 
 
-@dataclass()
+@attr.s(auto_attribs=True, slots=True, frozen=True)
 class ExtMetadata:
     """Ext metadata class to determine if extension should load at runtime depending on bot configuration."""
 
@@ -40,10 +40,6 @@ class ExtMetadata:
     # this is to determine if the cog is allowed to be unloaded.
     no_unload: bool = False
 
-    def __init__(self, load_if_mode: int = BotModes.PRODUCTION, no_unload: bool = False) -> "ExtMetadata":
-        self.load_if_mode = load_if_mode
-        self.no_unload = no_unload
-
 
 class ModmailCog(commands.Cog):
     """
@@ -17,6 +17,9 @@ log: ModmailLogger = logging.getLogger(__name__)
 
 EXT_METADATA = ExtMetadata
 
+# metadata presumed for extensions and plugins which do not define an EXT_METADATA variable
+DEFAULT_EXT_METADATA = ExtMetadata()
+
 
 EXTENSIONS: t.Dict[str, t.Tuple[bool, bool]] = dict()
 NO_UNLOAD: t.List[str] = list()
@@ -33,12 +36,13 @@ def determine_bot_mode() -> int:
 
     The configuration system uses true/false values, so we need to turn them into an integer for bitwise.
     """
-    bot_mode = 0
-    _config = config()
-    for mode in BotModes:
-        if getattr(_config.user.dev.mode, unqualify(str(mode)).lower(), True):
-            bot_mode += mode.value
-    return bot_mode
+    mode = config().user.dev.mode
+    # bools are ints, so each enabled mode contributes its bit and each disabled mode contributes 0
+    return int(
+        BotModes.PRODUCTION * mode.production
+        | BotModes.DEVELOP * mode.develop
+        | BotModes.PLUGIN_DEV * mode.plugin_dev
+    )
 
 
 BOT_MODE = determine_bot_mode()
@@ -50,7 +54,7 @@ log.debug(f"Plugin dev mode status: {bool(BOT_MODE & BOT_MODES.PLUGIN_DEV)}")
 
 
 def walk_extensions() -> t.Iterator[t.Tuple[str, t.Tuple[bool, bool]]]:
-    """Yield extension names from the modmail.exts subpackage."""
+    """Yield extension names from the modmail.extensions subpackage."""
 
     def on_error(name: str) -> t.NoReturn:
         raise ImportError(name=name)  # pragma: no cover
@@ -69,7 +73,7 @@ def walk_extensions() -> t.Iterator[t.Tuple[str, t.Tuple[bool, bool]]]:
         ext_metadata: ExtMetadata = getattr(imported, "EXT_METADATA", None)
         if ext_metadata is not None:
             # check if this cog is dev only or plugin dev only
-            load_cog = bool(int(ext_metadata.load_if_mode) & BOT_MODE)
+            load_cog = bool(ext_metadata.load_if_mode & BOT_MODE)
             log.trace(f"Load cog {module.name!r}?: {load_cog}")
             no_unload = ext_metadata.no_unload
             yield module.name, (load_cog, no_unload)
@@ -78,4 +82,4 @@ def walk_extensions() -> t.Iterator[t.Tuple[str, t.Tuple[bool, bool]]]:
         log.notice(f"Cog {module.name!r} is missing an EXT_METADATA variable. Assuming its a normal cog.")
 
         # Presume Production Mode/Metadata defaults if metadata var does not exist.
-        yield module.name, (ExtMetadata.load_if_mode, ExtMetadata.no_unload)
+        yield module.name, (DEFAULT_EXT_METADATA.load_if_mode, DEFAULT_EXT_METADATA.no_unload)
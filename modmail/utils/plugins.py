@@ -19,7 +19,7 @@ from pathlib import Path
 from modmail import plugins
 from modmail.log import ModmailLogger
 from modmail.utils.cogs import ExtMetadata
-from modmail.utils.extensions import BOT_MODE, unqualify
+from modmail.utils.extensions import BOT_MODE, DEFAULT_EXT_METADATA, unqualify
 
 
 log: ModmailLogger = logging.getLogger(__name__)
@@ -76,7 +76,7 @@ def walk_plugins() -> t.Iterator[t.Tuple[str, bool]]:
         ext_metadata: ExtMetadata = getattr(imported, "EXT_METADATA", None)
         if ext_metadata is not None:
             # check if this plugin is dev only or plugin dev only
-            load_cog = bool(int(ext_metadata.load_if_mode) & BOT_MODE)
+            load_cog = bool(ext_metadata.load_if_mode & BOT_MODE)
             log.trace(f"Load plugin {imported.__name__!r}?: {load_cog}")
             yield imported.__name__, load_cog
             continue
@@ -86,4 +86,4 @@ def walk_plugins() -> t.Iterator[t.Tuple[str, bool]]:
         )
 
         # Presume Production Mode/Metadata defaults if metadata var does not exist.
-        yield imported.__name__, ExtMetadata.load_if_mode
+        yield imported.__name__, DEFAULT_EXT_METADATA.load_if_mode
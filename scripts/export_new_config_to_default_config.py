@@ -5,21 +5,31 @@ This is intended to be used as a local pre-commit hook, which runs if the modmai
 """
 
 import difflib
+import functools
+import hashlib
 import json
 import os
 import pathlib
 import sys
 import textwrap
 import typing
-from collections import defaultdict
 
 import atoml
 import attr
 import click
-import dotenv
 import yaml
 
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeDumper
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
 try:
     import pygments
 except ModuleNotFoundError:
@@ -39,6 +49,9 @@ APP_JSON_FILE = MODMAIL_CONFIG_DIR.parent / "app.json"
 METADATA_TABLE = modmail.config.METADATA_TABLE
 MODMAIL_DIR = pathlib.Path(modmail.__file__).parent
 
+# diffs can be slow to generate, so only create them if someone is likely to read them
+SHOW_DIFF = sys.stdout.isatty() or os.environ.get("MODMAIL_EXPORT_DIFF", "").lower() in ("1", "true")
+
 
 def get_name(path: str) -> str:
     """Get the script module name of the provided file path."""
@@ -68,44 +81,63 @@ class MetadataDict(typing.TypedDict):
     required: bool
 
 
+# attrs classes do not change while exporting, so their fields only need to be looked up once
+_attr_fields = functools.lru_cache(maxsize=None)(attr.fields)
+_attr_has = functools.lru_cache(maxsize=None)(attr.has)
+
+
 class DidFileEdit:
-    """Check if a file is edited within the body of this class."""
+    """
+    Check if a file is edited within the body of this class.
+
+    If `show_diff` is False, only a digest of each file is kept and no diff is generated for edited files.
+    """
 
-    def __init__(self, *files: os.PathLike):
+    def __init__(self, *files: os.PathLike, show_diff: bool = True):
         self.files: typing.List[os.PathLike] = []
         for f in files:
             self.files.append(f)
+        self.show_diff = show_diff
         self.return_value: typing.Optional[int] = None
-        self.edited_files: typing.Dict[os.PathLike] = dict()
+        self.edited_files: typing.Dict[os.PathLike, typing.Optional[str]] = dict()
 
     def __enter__(self):
-        self.file_contents = {}
+        # keep the raw contents when a diff is wanted, otherwise only a digest is needed to detect edits
+        self.file_contents: typing.Dict[os.PathLike, typing.Optional[bytes]] = {}
         for file in self.files:
             try:
-                with open(file, "r") as f:
-                    self.file_contents[file] = f.readlines()
+                contents = pathlib.Path(file).read_bytes()
             except FileNotFoundError:
                 self.file_contents[file] = None
+            else:
+                self.file_contents[file] = contents if self.show_diff else hashlib.blake2b(contents).digest()
         return self
 
     def __exit__(self, exc_type, exc_value, exc_traceback):  # noqa: ANN001
         for file in self.files:
-            with open(file, "r") as f:
-                original_contents = self.file_contents[file]
-                new_contents = f.readlines()
-                if original_contents != new_contents:
-                    # construct a diff
-                    diff = difflib.unified_diff(
-                        original_contents, new_contents, fromfile="before", tofile="after"
-                    )
-                    try:
-                        diff = "".join(diff)
-                    except TypeError:
-                        diff = None
-                    else:
-                        if pygments is not None:
-                            diff = pygments.highlight(diff, DiffLexer(), Terminal256Formatter())
-                    self.edited_files[file] = diff
+            original_contents = self.file_contents[file]
+            new_contents = pathlib.Path(file).read_bytes()
+            if not self.show_diff:
+                new_contents = hashlib.blake2b(new_contents).digest()
+            if original_contents == new_contents:
+                continue
+
+            if not self.show_diff or original_contents is None:
+                self.edited_files[file] = None
+                continue
+
+            # construct a diff
+            diff = "".join(
+                difflib.unified_diff(
+                    original_contents.decode().splitlines(keepends=True),
+                    new_contents.decode().splitlines(keepends=True),
+                    fromfile="before",
+                    tofile="after",
+                )
+            )
+            if pygments is not None:
+                diff = pygments.highlight(diff, DiffLexer(), Terminal256Formatter())
+            self.edited_files[file] = diff
 
 
 def export_default_conf() -> int:
@@ -117,14 +149,7 @@ def export_default_conf() -> int:
     # This is the only place where the order of the config should matter, when exporting in a specific style
     def sort_dict(d: dict) -> dict:
         """Takes a dict and sorts it, recursively."""
-        sorted_dict = {x[0]: x[1] for x in sorted(d.items(), key=lambda e: e[0])}
-
-        for k, v in d.items():
-            if not isinstance(v, dict):
-                continue
-            sorted_dict[k] = sort_dict(v)
-
-        return sorted_dict
+        return {k: sort_dict(v) if isinstance(v, dict) else v for k, v in sorted(d.items())}
 
     dump = sort_dict(dump)
     doc = atoml.document()
@@ -133,7 +158,7 @@ def export_default_conf() -> int:
     toml_file = MODMAIL_CONFIG_DIR / (modmail.config.AUTO_GEN_FILE_NAME + ".toml")
     yaml_file = MODMAIL_CONFIG_DIR / (modmail.config.AUTO_GEN_FILE_NAME + ".yaml")
 
-    with DidFileEdit(toml_file, yaml_file) as check_file:
+    with DidFileEdit(toml_file, yaml_file, show_diff=SHOW_DIFF) as check_file:
         with open(toml_file, "w") as f:
             f.write(MESSAGE.format(file_type="TOML"))
             f.write("\n")
@@ -141,7 +166,7 @@ def export_default_conf() -> int:
 
         with open(yaml_file, "w") as f:
             f.write(MESSAGE.format(file_type="YAML"))
-            yaml.dump(dump, f, indent=4, Dumper=yaml.SafeDumper)
+            yaml.dump(dump, f, indent=4, Dumper=SafeDumper)
 
     for file, diff in check_file.edited_files.items():
         print(
@@ -150,6 +175,8 @@ def export_default_conf() -> int:
         )
         if diff is not None:
             click.echo(diff)
+        elif not check_file.show_diff:
+            click.echo("Diff skipped. Set MODMAIL_EXPORT_DIFF=1 to show it.")
         else:
             click.echo("No diff to show.")
         print()
@@ -177,77 +204,62 @@ def export_env_and_app_json_conf() -> int:
         # exact name, default value
         export: typing.Dict[str, MetadataDict] = dict()  # any missing required vars provide a sentinel
 
-        for var in attr.fields(klass):
-            if attr.has(var.type):
+        for var in _attr_fields(klass):
+            name = env_prefix + var.name.upper()
+            if _attr_has(var.type):
                 # var is an attrs class too, recurse over it
-                export.update(
-                    get_env_vars(
-                        var.type,
-                        env_prefix=env_prefix + var.name.upper() + "_",
-                    )
-                )
+                export.update(get_env_vars(var.type, env_prefix=name + "_"))
             else:
                 meta: MetadataDict = var.metadata
                 # put all values in the dict, we'll iterate through them later.
-                export[env_prefix + var.name.upper()] = meta
+                export[name] = meta
 
         return export
 
-    with DidFileEdit(ENV_EXPORT_FILE, APP_JSON_FILE) as check_file:
-        # parse the app_json file before clearing the ENV file
-        with open(APP_JSON_FILE) as f:
-            try:
-                app_json: typing.Dict = json.load(f)
-            except Exception as e:
-                print(
-                    "Oops! Please ensure the app.json file is valid json! "
-                    "If you've made manual edits, you may want to revert them.",
-                    file=sys.stderr,
-                )
-                raise e
-
-        # dotenv modifies currently existing files, but we want to erase the current file
-        # to ensure that there are no extra environment variables
-        ENV_EXPORT_FILE.unlink(missing_ok=True)
-        ENV_EXPORT_FILE.touch()
+    with DidFileEdit(ENV_EXPORT_FILE, APP_JSON_FILE, show_diff=SHOW_DIFF) as check_file:
+        # parse the app_json file before it is rewritten
+        try:
+            # orjson only speeds up parsing here, as its output can't be indented with 4 spaces
+            app_json: typing.Dict = (orjson or json).loads(APP_JSON_FILE.read_bytes())
+        except Exception as e:
+            print(
+                "Oops! Please ensure the app.json file is valid json! "
+                "If you've made manual edits, you may want to revert them.",
+                file=sys.stderr,
+            )
+            raise e
 
         exported = get_env_vars(type(default))
 
+        env_lines: typing.List[str] = []
         app_json_env = dict()
 
         for key, meta in exported.items():
-            # if the value is required, or explicity asks to be exported, then we want to export it
-            if meta[METADATA_TABLE].export_to_env_template or meta.get("required", False):
-
-                dotenv.set_key(
-                    ENV_EXPORT_FILE,
-                    key,
-                    meta[METADATA_TABLE].export_environment_prefill or meta["default"],
-                )
+            metadata: modmail.config.ConfigMetadata = meta[METADATA_TABLE]
+            required = meta.get("required", False)
+            export_to_env = metadata.export_to_env_template or required
 
-            if (
-                meta[METADATA_TABLE].export_to_app_json
-                or meta[METADATA_TABLE].export_to_env_template
-                or meta.get("required", False)
-            ):
-                description = (
-                    f"{meta[METADATA_TABLE].description}\n{meta[METADATA_TABLE].extended_description or ''}"
-                ).strip()
-                options = defaultdict(
-                    str,
-                    {
-                        "description": description,
-                        "required": meta[METADATA_TABLE].app_json_required or meta.get("required", False),
-                    },
-                )
-                if (value := meta[modmail.config.METADATA_TABLE].app_json_default) is not None:
+            # if the value is required, or explicity asks to be exported, then we want to export it
+            if export_to_env:
+                env_value = str(metadata.export_environment_prefill or meta["default"])
+                # quote the same way as dotenv.set_key does by default
+                env_lines.append("{}='{}'\n".format(key, env_value.replace("'", "\\'")))
+
+            if export_to_env or metadata.export_to_app_json:
+                description = f"{metadata.description}\n{metadata.extended_description or ''}".strip()
+                options = {
+                    "description": description,
+                    "required": metadata.app_json_required or required,
+                }
+                if (value := metadata.app_json_default) is not None:
                     options["value"] = value
                 app_json_env[key] = options
 
+        # the env file is rewritten in full to ensure that there are no extra environment variables
+        ENV_EXPORT_FILE.write_text("".join(env_lines))
+
         app_json["env"] = app_json_env
-        with open(APP_JSON_FILE, "w") as f:
-            json.dump(app_json, f, indent=4)
-            f.write("\n")
+        APP_JSON_FILE.write_text(json.dumps(app_json, indent=4) + "\n")
 
     for file, diff in check_file.edited_files.items():
         print(
@@ -256,6 +268,8 @@ def export_env_and_app_json_conf() -> int:
         )
         if diff is not None:
             click.echo(diff)
+        elif not check_file.show_diff:
+            click.echo("Diff skipped. Set MODMAIL_EXPORT_DIFF=1 to show it.")
         else:
             click.echo("No diff to show.")
         print()
@@ -8,14 +8,16 @@ from modmail.utils.extensions import walk_extensions
 
 
 # load EXTENSIONS
+# walk once during collection, since walking imports every module and the result is reused below
+WALKED_EXTENSIONS = dict(walk_extensions())
 EXTENSIONS = copy(GLOBAL_EXTENSIONS)
-EXTENSIONS.update(walk_extensions())
+EXTENSIONS.update(WALKED_EXTENSIONS)
 
 
 class TestExtensionConverter:
     """Test the extension converter converts extensions properly."""
 
-    all_extensions = {x: y for x, y in walk_extensions()}
+    all_extensions = WALKED_EXTENSIONS
 
     @pytest.fixture(scope="class", name="converter")
     def converter(self) -> ExtensionConverter:
@@ -7,15 +7,17 @@ from modmail.utils.plugins import PLUGINS as GLOBAL_PLUGINS
 from modmail.utils.plugins import walk_plugins
 
 
-# load EXTENSIONS
+# load PLUGINS
+# walk once during collection, since walking imports every module and the result is reused below
+WALKED_PLUGINS = dict(walk_plugins())
 PLUGINS = copy(GLOBAL_PLUGINS)
-PLUGINS.update(walk_plugins())
+PLUGINS.update(WALKED_PLUGINS)
 
 
 class TestPluginConverter:
     """Test the extension converter converts extensions properly."""
 
-    all_plugins = {x: y for x, y in walk_plugins()}
+    all_plugins = WALKED_PLUGINS
 
     @pytest.fixture(scope="class", name="converter")
     def converter(self) -> PluginConverter: